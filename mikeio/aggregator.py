@@ -13,7 +13,11 @@ from DHI.Generic.MikeZero.DFS import (
 )
 from DHI.Generic.MikeZero.DFS.dfs123 import Dfs1Builder
 
-from .dotnet import to_numpy, to_dotnet_float_array
+from .dotnet import (
+    to_numpy,
+    to_dotnet_array,
+    copy_to_dotnet_array,
+)
 from .helpers import safe_length
 
 
@@ -103,20 +107,27 @@ def dfs2todfs1(dfs2file, dfs1file, axis=1, func=np.nanmean):
 
     # read-write data
     deleteValue = fileInfo.DeleteValueFloat
+    # all items of a timestep are staged in one [item, y, x] block
+    data = np.empty((n_items, ax.YCount, ax.XCount), dtype=np.float32)
+    n_out = ax.XCount if axis == 1 else ax.YCount
+    out = np.empty((n_items, n_out), dtype=np.float32)
+    darray = to_dotnet_array(out[0])
+    read = dfs_in.ReadItemTimeStepNext
+    write = dfs_out.WriteItemTimeStepNext
     for it in range(n_time_steps):
         for item in range(n_items):
-            itemdata = dfs_in.ReadItemTimeStep(item + 1, it)
-
-            d = to_numpy(itemdata.Data)
-            d[d == deleteValue] = np.nan
-            d2 = d.reshape(ax.YCount, ax.XCount)
-            d2 = np.flipud(d2)
+            itemdata = read()
+            data[item] = to_numpy(itemdata.Data).reshape(ax.YCount, ax.XCount)
 
-            d1 = func(d2, axis=axis - 1)
-            d1[np.isnan(d1)] = deleteValue
+        data[data == deleteValue] = np.nan
+        d = data[:, ::-1, :]  # flipud
+        for item in range(n_items):
+            out[item] = func(d[item], axis=axis - 1)
+        out[np.isnan(out)] = deleteValue
 
-            darray = to_dotnet_float_array(d1)
-            dfs_out.WriteItemTimeStepNext(itemdata.Time, darray)
+        for item in range(n_items):
+            copy_to_dotnet_array(out[item], darray)
+            write(itemdata.Time, darray)
 
     dfs_in.Close()
     dfs_out.Close()
@@ -175,20 +186,25 @@ def dfstodfs0(dfsfile, dfs0file, func=np.nanmean):
 
     # read-write data
     deleteValue = fileInfo.DeleteValueFloat
+    read = dfs_in.ReadItemTimeStepNext
+    write = dfs_out.WriteItemTimeStepNext
+    # the values of all items of a timestep, written through one .NET buffer
+    values = np.empty((n_items, 1), dtype=np.float32)
+    darray = to_dotnet_array(values[0])
     for it in range(n_time_steps):
         for item in range(n_items):
-            itemdata = dfs_in.ReadItemTimeStep(item + 1, it)
+            itemdata = read()
 
             d = to_numpy(itemdata.Data)
             d[d == deleteValue] = np.nan
 
-            d0 = func(d)
-            d = np.zeros(1)
-            d[0] = d0
-            d[np.isnan(d)] = deleteValue
+            values[item] = func(d)
 
-            darray = to_dotnet_float_array(d)
-            dfs_out.WriteItemTimeStepNext(itemdata.Time, darray)
+        values[np.isnan(values)] = deleteValue
+
+        for item in range(n_items):
+            copy_to_dotnet_array(values[item], darray)
+            write(itemdata.Time, darray)
 
     dfs_in.Close()
     dfs_out.Close()
@@ -8,7 +8,8 @@ from .dotnet import (
     to_dotnet_datetime,
     from_dotnet_datetime,
     to_numpy,
-    to_dotnet_float_array,
+    to_dotnet_array,
+    copy_to_dotnet_array,
 )
 from .eum import ItemInfo, TimeStepUnit, EUMType, EUMUnit
 from .custom_exceptions import DataDimensionMismatch, ItemNumbersError
@@ -150,21 +151,29 @@ class _Dfs123:
 
         deletevalue = dfs.FileInfo.DeleteValueFloat  # -1.0000000031710769e-30
 
+        if self._ndim == 1:
+            frame_shape = (self._nx,)
+        else:
+            frame_shape = (self._ny, self._nx)
+
+        # every item-timestep is cast into one float32 buffer, where delete
+        # values are substituted, and copied into one reused .NET array
+        buf = np.empty(frame_shape, dtype=np.float32)
+        darray = to_dotnet_array(buf.ravel())
+        write = dfs.WriteItemTimeStepNext
+
         for i in range(self._n_timesteps):
             for item in range(self._n_items):
 
                 d = self._data[item][i]
-                d[np.isnan(d)] = deletevalue
-
-                if self._ndim == 1:
-                    darray = to_dotnet_float_array(d)
 
                 if self._ndim == 2:
-                    d = d.reshape(self.shape[1:])
-                    d = np.flipud(d)
-                    darray = to_dotnet_float_array(d.reshape(d.size, 1)[:, 0])
+                    d = np.flipud(np.reshape(d, frame_shape))
+
+                np.copyto(buf, d, casting="unsafe")
+                buf[np.isnan(buf)] = deletevalue
 
-                dfs.WriteItemTimeStepNext(0, darray)
+                write(0, copy_to_dotnet_array(buf, darray))
 
         dfs.Close()
 
@@ -304,8 +313,8 @@ class _Dfs123:
                 time_steps = slice(parts[0], parts[1])
 
         if isinstance(time_steps, slice):
-            freq = pd.tseries.offsets.DateOffset(seconds=self.timestep)
-            time = pd.date_range(self.start_time, periods=self.n_timesteps, freq=freq)
+            t_seconds = np.arange(self.n_timesteps) * self.timestep
+            time = pd.Timestamp(self.start_time) + pd.to_timedelta(t_seconds, unit="s")
             s = time.slice_indexer(time_steps.start, time_steps.stop)
             time_steps = list(range(s.start, s.stop))
 
@@ -361,13 +370,16 @@ class _Dfs123:
         list[Iteminfo]
         """
         items = []
+        item_infos = self._dfs.ItemInfo
         for item in item_numbers:
-            name = self._dfs.ItemInfo[item].Name
-            eumItem = self._dfs.ItemInfo[item].Quantity.Item
-            eumUnit = self._dfs.ItemInfo[item].Quantity.Unit
+            item_info = item_infos[item]
+            quantity = item_info.Quantity
+            name = item_info.Name
+            eumItem = quantity.Item
+            eumUnit = quantity.Unit
             itemtype = EUMType(eumItem)
             unit = EUMUnit(eumUnit)
-            data_value_type = self._dfs.ItemInfo[item].get_ValueType()
+            data_value_type = item_info.get_ValueType()
             item = ItemInfo(name, itemtype, unit, data_value_type)
             items.append(item)
         return items
@@ -2,8 +2,6 @@ import os
 from DHI.Generic.MikeZero import eumUnit
 from DHI.Generic.MikeZero.DFS import DfsFileFactory
 from DHI.Generic.MikeZero.DFS.dfs123 import Dfs2Builder, Dfs2Reprojector
-from DHI.Generic.MikeZero.DFS import DfsFileFactory
-from DHI.Generic.MikeZero.DFS.dfs123 import Dfs2Builder
 from DHI.Projections import Cartography
 
 
@@ -19,6 +17,7 @@ class Dfs2(_Dfs123):
     _ny = None
     _x0 = 0
     _y0 = 0
+    _cart = None
 
     def __init__(self, filename=None):
         super(Dfs2, self).__init__(filename)
@@ -80,25 +79,25 @@ class Dfs2(_Dfs123):
 
         (int,int): indexes in y, x 
         """
-        dfs = DfsFileFactory.Dfs2FileOpen(self._filename)
-        self._dfs = dfs
-        projection = self._dfs.FileInfo.Projection
-        axis = self._dfs.SpatialAxis
-        cart = Cartography(
-            projection.WKTString,
-            projection.Longitude,
-            projection.Latitude,
-            projection.Orientation,
-        )
-
-        # C# out parameters must be handled in special way
-        (_, xx, yy) = cart.Geo2Xy(lon, lat, 0.0, 0.0)
-
-        j = int(xx / axis.Dx + 0.5)
-        k = axis.YCount - int(yy / axis.Dy + 0.5) - 1
-
-        j = min(max(0, j), axis.XCount - 1)
-        k = min(max(0, k), axis.YCount - 1)
+        if self._projstr == "LONG/LAT" and self._orientation == 0:
+            # regular lon/lat grid, offset from origin is the grid coordinate
+            xx = lon - self._longitude
+            yy = lat - self._latitude
+        else:
+            if self._cart is None:
+                # projection is known from the header, no need to reopen file
+                self._cart = Cartography(
+                    self._projstr, self._longitude, self._latitude, self._orientation,
+                )
+
+            # C# out parameters must be handled in special way
+            (_, xx, yy) = self._cart.Geo2Xy(lon, lat, 0.0, 0.0)
+
+        j = int(xx / self._dx + 0.5)
+        k = self._ny - int(yy / self._dy + 0.5) - 1
+
+        j = min(max(0, j), self._nx - 1)
+        k = min(max(0, k), self._ny - 1)
 
         return k, j
 
@@ -184,13 +183,12 @@ class Dfs2(_Dfs123):
         return self._dy
 
     @property
-<<<<<<< HEAD
     def dt(self):
         """Step size in y direction
         """
         return self._dt
 
-=======
+    @property
     def shape(self):
         return (self._n_timesteps, self._ny, self._nx)
 
@@ -273,4 +271,3 @@ class Dfs2(_Dfs123):
             dy,
         )
         tool.Process()
->>>>>>> e37c02fe0e7f68046e48742dc42cd2fdebeaed78
@@ -21,6 +21,7 @@ from .dotnet import (
     from_dotnet_datetime,
     asNumpyArray,
     to_dotnet_array,
+    copy_to_dotnet_array,
     asnetarray_v2,
 )
 from .dfs0 import Dfs0
@@ -51,6 +52,15 @@ class UnstructuredType(IntEnum):
     Dfsu3DSigmaZ = 5
 
 
+# type groups used for O(1) membership tests
+_DFSU_3D_TYPES = frozenset(
+    {UnstructuredType.Dfsu3DSigma, UnstructuredType.Dfsu3DSigmaZ}
+)
+_DFSU_SIGMA_Z_TYPES = frozenset(
+    {UnstructuredType.DfsuVerticalProfileSigmaZ, UnstructuredType.Dfsu3DSigmaZ}
+)
+
+
 class _UnstructuredGeometry:
     # THIS CLASS KNOWS NOTHING ABOUT MIKE FILES!
     _type = None  # -1: mesh, 0: 2d-dfsu, 4:dfsu3dsigma, ...
@@ -62,6 +72,8 @@ class _UnstructuredGeometry:
     _ec = None
     _codes = None
     _valid_codes = None
+    _boundary_codes = None
+    _code_node_ids = None
     _element_ids = None
     _node_ids = None
     _element_table = None
@@ -135,14 +147,29 @@ class _UnstructuredGeometry:
         """Unique list of node codes
         """
         if self._valid_codes is None:
-            self._valid_codes = list(set(self.codes))
+            self._valid_codes = np.unique(self.codes).tolist()
         return self._valid_codes
 
+    @property
+    def _node_ids_by_code(self):
+        """Dict with the node indices of each code
+        """
+        if self._code_node_ids is None:
+            codes = np.asarray(self.codes)
+            order = np.argsort(codes, kind="stable")
+            unique_codes, first = np.unique(codes[order], return_index=True)
+            node_ids = np.split(order, first[1:])
+            self._code_node_ids = dict(zip(unique_codes.tolist(), node_ids))
+        return self._code_node_ids
+
     @property
     def boundary_codes(self):
         """provides a unique list of boundary codes
         """
-        return [code for code in self.valid_codes if code > 0]
+        if self._boundary_codes is None:
+            codes = np.asarray(self.valid_codes)
+            self._boundary_codes = codes[codes > 0].tolist()
+        return self._boundary_codes
 
     @property
     def projection_string(self):
@@ -217,7 +244,7 @@ class _UnstructuredGeometry:
                     f"Selected code: {code} is not valid. Valid codes: {self.valid_codes}"
                 )
                 raise Exception
-            return nc[self.codes == code]
+            return nc[self._node_ids_by_code[code]]
         return nc
 
     def _get_element_table_from_dotnet(self):
@@ -231,15 +258,34 @@ class _UnstructuredGeometry:
 
     def _element_table_to_dotnet(self, elem_table=None):
         if elem_table is None:
+            if (self._element_table is None) and (
+                self._element_table_dotnet is not None
+            ):
+                # table read from file is already 1-based dotnet
+                return self._element_table_dotnet
             elem_table = self._element_table
-        new_elem_table = []
-        n_elements = len(elem_table)
-        for j in range(n_elements):
-            elem_nodes = elem_table[j]
-            elem_nodes = [nd + 1 for nd in elem_nodes]  # make 1-based
-            new_elem_table.append(elem_nodes)
+        if isinstance(elem_table, np.ndarray) and elem_table.ndim == 2:
+            # homogeneous mesh: single vectorized increment
+            new_elem_table = (elem_table + 1).tolist()  # make 1-based
+        else:
+            new_elem_table = [
+                [nd + 1 for nd in elem_nodes] for elem_nodes in elem_table
+            ]  # make 1-based
         return asnetarray_v2(new_elem_table)
 
+    def _nodes_to_dotnet(self, z_as_float=False):
+        """x, y, z and codes of all nodes as separate dotnet arrays"""
+        # columns are copied to contiguous arrays and memmoved to dotnet
+        nc = self.node_coordinates
+        xn = to_dotnet_array(np.ascontiguousarray(nc[:, 0], dtype=np.float64))
+        yn = to_dotnet_array(np.ascontiguousarray(nc[:, 1], dtype=np.float64))
+        if z_as_float:
+            zn = to_dotnet_float_array(nc[:, 2])
+        else:
+            zn = to_dotnet_array(np.ascontiguousarray(nc[:, 2], dtype=np.float64))
+        codes = to_dotnet_array(np.asarray(self.codes, dtype=np.int32))
+        return xn, yn, zn, codes
+
     def _set_nodes(
         self, node_coordinates, codes=None, node_ids=None, projection_string=None
     ):
@@ -331,10 +377,7 @@ class _UnstructuredGeometry:
             unique_layer_ids = np.unique(layers_used)
             n_layers = len(unique_layer_ids)
 
-            if (
-                self._type == UnstructuredType.Dfsu3DSigma
-                or self._type == UnstructuredType.Dfsu3DSigmaZ
-            ) and n_layers == 1:
+            if self._type in _DFSU_3D_TYPES and n_layers == 1:
                 # If source is 3d, but output only has 1 layer
                 # then change type to 2d
                 geom._type = UnstructuredType.Dfsu2D
@@ -351,10 +394,7 @@ class _UnstructuredGeometry:
 
                 # If source is sigma-z but output only has sigma layers
                 # then change type accordingly
-                if (
-                    self._type == UnstructuredType.DfsuVerticalProfileSigmaZ
-                    or self._type == UnstructuredType.Dfsu3DSigmaZ
-                ) and n_layers == geom._n_sigma:
+                if self._type in _DFSU_SIGMA_Z_TYPES and n_layers == geom._n_sigma:
                     geom._type = UnstructuredType(self._type.value - 1)
 
                 geom._top_elems = geom._get_top_elements_from_coordinates()
@@ -488,6 +528,7 @@ class _UnstructuredGeometry:
         zcoords = np.zeros([maxnodes, n_elements])
         nnodes_per_elem = np.zeros(n_elements)
 
+        nc = self.node_coordinates
         for j in range(n_elements):
             nodes = self._element_table[j]
             nnodes = len(nodes)
@@ -495,9 +536,9 @@ class _UnstructuredGeometry:
             for i in range(nnodes):
                 idx[i] = nodes[i]  # - 1
 
-            xcoords[:nnodes, j] = self._nc[idx[:nnodes], 0]
-            ycoords[:nnodes, j] = self._nc[idx[:nnodes], 1]
-            zcoords[:nnodes, j] = self._nc[idx[:nnodes], 2]
+            xcoords[:nnodes, j] = nc[idx[:nnodes], 0]
+            ycoords[:nnodes, j] = nc[idx[:nnodes], 1]
+            zcoords[:nnodes, j] = nc[idx[:nnodes], 2]
 
         ec[:, 0] = np.sum(xcoords, axis=0) / nnodes_per_elem
         ec[:, 1] = np.sum(ycoords, axis=0) / nnodes_per_elem
@@ -653,7 +694,7 @@ class _UnstructuredGeometry:
         elif layer is None:
             idx = np.zeros_like(elem2d)
             if np.isscalar(z):
-                z = z * np.ones_like(elem2d, dtype=float)
+                z = np.full(elem2d.shape, z, dtype=float)
             elem3d = self.e2_e3_table[elem2d]
             for j, row in enumerate(elem3d):
                 zc = self.element_coordinates[row, 2]
@@ -1463,10 +1504,7 @@ class _UnstructuredFile(_UnstructuredGeometry):
             out.append(f"Projection: {self.projection_string}")
         if not self.is_2d:
             out.append(f"Number of sigma layers: {self.n_sigma_layers}")
-        if (
-            self._type == UnstructuredType.DfsuVerticalProfileSigmaZ
-            or self._type == UnstructuredType.Dfsu3DSigmaZ
-        ):
+        if self._type in _DFSU_SIGMA_Z_TYPES:
             out.append(f"Max number of z layers: {self.n_layers - self.n_sigma_layers}")
         if self._n_items is not None:
             if self._n_items < 10:
@@ -1544,20 +1582,51 @@ class _UnstructuredFile(_UnstructuredGeometry):
 
         dfs.Close()
 
+    @property
+    def node_coordinates(self):
+        """Coordinates (x,y,z) of all nodes
+        """
+        self._load_nodes()
+        return self._nc
+
+    @property
+    def node_ids(self):
+        self._load_nodes()
+        return self._node_ids
+
+    @property
+    def element_ids(self):
+        if (self._element_ids is None) and (self._source is not None):
+            self._element_ids = np.array(list(self._source.ElementIds)) - 1
+        return self._element_ids
+
+    @property
+    def codes(self):
+        """Node codes of all nodes
+        """
+        self._load_nodes()
+        return self._codes
+
+    def _load_nodes(self):
+        # nodes of a file are only converted from dotnet when first needed
+        if (self._nc is None) and (self._source is not None):
+            source = self._source
+            xn = asNumpyArray(source.X)
+            yn = asNumpyArray(source.Y)
+            zn = asNumpyArray(source.Z)
+            self._nc = np.column_stack([xn, yn, zn])
+            self._codes = np.array(list(source.Code))
+            self._node_ids = np.array(list(source.NodeIds)) - 1
+
     def _set_nodes_from_source(self, source):
-        xn = asNumpyArray(source.X)
-        yn = asNumpyArray(source.Y)
-        zn = asNumpyArray(source.Z)
-        self._nc = np.column_stack([xn, yn, zn])
-        self._codes = np.array(list(source.Code))
         self._n_nodes = source.NumberOfNodes
-        self._node_ids = np.array(list(source.NodeIds)) - 1
+        self._nc = None  # do later if needed
 
     def _set_elements_from_source(self, source):
         self._n_elements = source.NumberOfElements
         self._element_table_dotnet = source.ElementTable
         self._element_table = None  # do later if needed
-        self._element_ids = np.array(list(source.ElementIds)) - 1
+        self._element_ids = None  # do later if needed
 
 
 class Dfsu(_UnstructuredFile):
@@ -1648,6 +1717,17 @@ class Dfsu(_UnstructuredFile):
             seconds=((self.n_timesteps - 1) * self.timestep)
         )
 
+    def _open_data(self):
+        """Open file for reading item data (geometry is known from header)"""
+        # the generic file object does not rebuild the mesh like DfsuFile.Open
+        dfs = DfsFileFactory.DfsGenericOpen(self._filename)
+        # time may have changes since we read the header
+        # (if engine is continuously writing to this file)
+        self._n_timesteps = dfs.FileInfo.TimeAxis.NumberOfTimeSteps
+        # TODO: add more checks that this is actually still the same file
+        # (could have been replaced in the meantime)
+        return dfs
+
     def read(self, items=None, time_steps=None, elements=None):
         """
         Read data from a dfsu file
@@ -1689,19 +1769,11 @@ class Dfsu(_UnstructuredFile):
         """
 
         # Open the dfs file for reading
-        # self._read_dfsu_header(self._filename)
-        dfs = DfsuFile.Open(self._filename)
-        # time may have changes since we read the header
-        # (if engine is continuously writing to this file)
-        self._n_timesteps = dfs.NumberOfTimeSteps
-        # TODO: add more checks that this is actually still the same file
-        # (could have been replaced in the meantime)
+        dfs = self._open_data()
 
         # NOTE. Item numbers are base 0 (everything else in the dfs is base 0)
         # n_items = self.n_items #safe_length(dfs.ItemInfo)
 
-        nt = self.n_timesteps  # .NumberOfTimeSteps
-
         items, item_numbers, time_steps = get_valid_items_and_timesteps(
             self, items, time_steps
         )
@@ -1712,49 +1784,83 @@ class Dfsu(_UnstructuredFile):
             n_elems = self.n_elements
             n_nodes = self.n_nodes
         else:
+            # convert once; indices and gather buffers are reused every step
+            elements = np.atleast_1d(np.asarray(elements, dtype=np.intp))
+            n = self.n_elements
+            if np.any((elements < -n) | (elements >= n)):
+                raise IndexError(f"Element ids must be in range [0, {n})")
+            elements = elements % n  # negative ids count from the end
             node_ids, _ = self._get_nodes_and_table_for_elements(elements)
             n_elems = len(elements)
             n_nodes = len(node_ids)
+            elem_buf = np.empty(n_elems, dtype=np.float32)
+            node_buf = np.empty(n_nodes, dtype=np.float32)
 
         deletevalue = self.deletevalue
 
-        data_list = []
+        nt = len(time_steps)
+        item0_is_node_based = n_items > 0 and items[0].name == "Z coordinate"
+        n_elem_items = n_items - 1 if item0_is_node_based else n_items
 
-        item0_is_node_based = False
-        for item in range(n_items):
-            # Initialize an empty data block
-            if item == 0 and items[item].name == "Z coordinate":
-                item0_is_node_based = True
-                data = np.ndarray(shape=(len(time_steps), n_nodes), dtype=self._dtype)
-            else:
-                data = np.ndarray(shape=(len(time_steps), n_elems), dtype=self._dtype)
-            data_list.append(data)
+        # Initialize a single data block for all element-based items
+        block = np.empty((n_elem_items, nt, n_elems), dtype=self._dtype)
+        data_list = [block[k] for k in range(n_elem_items)]
+        if item0_is_node_based:
+            data_list.insert(0, np.empty((nt, n_nodes), dtype=self._dtype))
+
+        # decide once per item (not every step) which values to gather
+        if elements is None:
+            gathers = [None] * n_items
+        else:
+            gathers = [(elements, elem_buf)] * n_items
+            if item0_is_node_based:
+                gathers[0] = (node_ids, node_buf)
 
         t_seconds = np.zeros(len(time_steps), dtype=float)
 
+        # all items of contiguous timesteps are stored back-to-back in the
+        # file and can be read in sequence instead of seeking every item
+        sequential = (
+            len(time_steps) > 0
+            and list(item_numbers) == list(range(self.n_items))
+            and np.all(np.diff(time_steps) == 1)
+        )
+        if sequential:
+            dfs.FindItem(1, time_steps[0])
+
+            def read_item_timestep(item_number, step):
+                return dfs.ReadItemTimeStepNext()
+
+        else:
+
+            def read_item_timestep(item_number, step):
+                return dfs.ReadItemTimeStep(item_number + 1, step)
+
         for i in range(len(time_steps)):
             it = time_steps[i]
             for item in range(n_items):
 
-                itemdata = dfs.ReadItemTimeStep(item_numbers[item] + 1, it)
+                itemdata = read_item_timestep(item_numbers[item], it)
 
                 src = itemdata.Data
 
                 d = to_numpy(src)
 
-                d[d == deletevalue] = np.nan
-
-                if elements is not None:
-                    if item == 0 and item0_is_node_based:
-                        d = d[node_ids]
-                    else:
-                        d = d[elements]
+                gather = gathers[item]
+                if gather is not None:
+                    # indices are checked above, "clip" avoids copying out
+                    d = np.take(d, gather[0], out=gather[1], mode="clip")
 
                 data_list[item][i, :] = d
 
             t_seconds[i] = itemdata.Time
 
-        time = [self.start_time + timedelta(seconds=tsec) for tsec in t_seconds]
+        # mask delete values in one pass per item instead of once per timestep
+        for data in data_list:
+            data[data == deletevalue] = np.nan
+
+        # build time axis in one vectorized step from the collected offsets
+        time = pd.Timestamp(self.start_time) + pd.to_timedelta(t_seconds, unit="s")
 
         dfs.Close()
         return Dataset(data_list, time, items)
@@ -1791,8 +1897,7 @@ class Dfsu(_UnstructuredFile):
         >>> ds = dfsu.extract_track('track_file.csv', items=0)
         """
 
-        dfs = DfsuFile.Open(self._filename)
-        self._n_timesteps = dfs.NumberOfTimeSteps
+        dfs = self._open_data()
 
         items, item_numbers, time_steps = get_valid_items_and_timesteps(
             self, items, time_steps=None
@@ -2006,6 +2111,14 @@ class Dfsu(_UnstructuredFile):
             title of the dfsu file. Default is blank.
         keep_open: bool, optional
             Keep file open for appending
+
+        Notes
+        -----
+        If all items have the same shape, the data is converted to a single
+        float32 block of shape (item, time, element) before writing. Peak
+        memory is therefore about half the size of the float64 input on top
+        of the input itself. Large datasets can be written in chunks with
+        `write_header` and `append`.
         """
 
         if isinstance(data, Dataset):
@@ -2020,9 +2133,6 @@ class Dfsu(_UnstructuredFile):
             data = data.data
 
         n_items = len(data)
-        n_time_steps = 0
-        if n_items > 0:
-            n_time_steps = np.shape(data[0])[0]
 
         if dt is None:
             if self.timestep is None:
@@ -2084,22 +2194,14 @@ class Dfsu(_UnstructuredFile):
             if items[0].name != "Z coordinate":
                 raise Exception("First item must be z coordinates of the nodes!")
 
-        xn = geometry.node_coordinates[:, 0]
-        yn = geometry.node_coordinates[:, 1]
-
         # zn have to be Single precision??
-        zn = to_dotnet_float_array(geometry.node_coordinates[:, 2])
+        xn, yn, zn, codes = geometry._nodes_to_dotnet(z_as_float=True)
 
-        elem_table = []
-        for j in range(geometry.n_elements):
-            elem_nodes = geometry.element_table[j]
-            elem_nodes = [nd + 1 for nd in elem_nodes]
-            elem_table.append(elem_nodes)
-        elem_table = asnetarray_v2(elem_table)
+        elem_table = geometry._element_table_to_dotnet()
 
         builder = DfsuBuilder.Create(dfsu_filetype)
 
-        builder.SetNodes(xn, yn, zn, geometry.codes)
+        builder.SetNodes(xn, yn, zn, codes)
         builder.SetElements(elem_table)
         # builder.SetNodeIds(geometry.node_ids+1)
         # builder.SetElementIds(geometry.elements+1)
@@ -2124,16 +2226,9 @@ class Dfsu(_UnstructuredFile):
         except IOError:
             print("cannot create dfsu file: ", filename)
 
-        deletevalue = self._dfs.DeleteValueFloat
-
         try:
             # Add data for all item-timesteps, copying from source
-            for i in range(n_time_steps):
-                for item in range(n_items):
-                    d = data[item][i, :]
-                    d[np.isnan(d)] = deletevalue
-                    darray = to_dotnet_float_array(d)
-                    self._dfs.WriteItemTimeStepNext(0, darray)
+            self._write_timesteps(data)
             if not keep_open:
                 self._dfs.Close()
             else:
@@ -2151,16 +2246,43 @@ class Dfsu(_UnstructuredFile):
         -----------
         data: list[np.array]
         """
+        self._write_timesteps(data)
 
-        deletevalue = self._dfs.DeleteValueFloat
+    def _write_timesteps(self, data):
+        """Write all timesteps of data (list of [t, x] matrices) to open file"""
         n_items = len(data)
+        if n_items == 0:
+            return
         n_time_steps = np.shape(data[0])[0]
+        if n_time_steps == 0:
+            return
+        deletevalue = self._dfs.DeleteValueFloat
+
+        # convert to float32 once (NaN survives the cast); rows of the
+        # C-contiguous copies can then be handed over without copying
+        if len({np.shape(d) for d in data}) == 1:
+            # all items share shape: a single [item, t, x] block
+            data_f32 = np.array(data, dtype=np.float32, order="C")
+            np.nan_to_num(
+                data_f32, copy=False, nan=deletevalue, posinf=np.inf, neginf=-np.inf
+            )
+        else:
+            # e.g. node-based z coordinate item of 3d files
+            data_f32 = []
+            for d in data:
+                d = np.array(d, dtype=np.float32, order="C")
+                d[np.isnan(d)] = deletevalue
+                data_f32.append(d)
+
+        # the file copies the values on write, so one .NET array per item
+        # can be refilled for every timestep
+        darrays = [to_dotnet_array(d[0]) for d in data_f32]
+        write = self._dfs.WriteItemTimeStepNext
+
         for i in range(n_time_steps):
             for item in range(n_items):
-                d = data[item][i, :]
-                d[np.isnan(d)] = deletevalue
-                darray = to_dotnet_float_array(d)
-                self._dfs.WriteItemTimeStepNext(0, darray)
+                darray = copy_to_dotnet_array(data_f32[item][i], darrays[item])
+                write(0, darray)
 
     def close(self):
         "Finalize write for a dfsu file opened with `write(...,keep_open=True)`"
@@ -2210,7 +2332,7 @@ class Mesh(_UnstructuredFile):
         """
         if len(z) != self.n_nodes:
             raise Exception(f"z must have length of nodes ({self.n_nodes})")
-        self._nc[:, 2] = z
+        self.node_coordinates[:, 2] = z
         self._ec = None
 
     def set_codes(self, codes):
@@ -2223,8 +2345,11 @@ class Mesh(_UnstructuredFile):
         """
         if len(codes) != self.n_nodes:
             raise Exception(f"codes must have length of nodes ({self.n_nodes})")
+        self._load_nodes()
         self._codes = codes
         self._valid_codes = None
+        self._boundary_codes = None
+        self._code_node_ids = None
 
     def write(self, outfilename, elements=None):
         """write mesh to file (will overwrite if file exists)
@@ -2247,8 +2372,7 @@ class Mesh(_UnstructuredFile):
             quantity = eumQuantity.Create(EUMType.Bathymetry, EUMUnit.meter)
             elem_table = geometry._element_table_to_dotnet()
 
-        nc = geometry.node_coordinates
-        builder.SetNodes(nc[:, 0], nc[:, 1], nc[:, 2], geometry.codes)
+        builder.SetNodes(*geometry._nodes_to_dotnet())
 
         builder.SetElements(elem_table)
         builder.SetProjection(geometry.projection_string)
@@ -2264,7 +2388,6 @@ class Mesh(_UnstructuredFile):
         import matplotlib.pyplot as plt
 
         nc = self.node_coordinates
-        c = self.codes
 
         if boundary_names is not None:
             if len(self.boundary_codes) != len(boundary_names):
@@ -2275,8 +2398,9 @@ class Mesh(_UnstructuredFile):
 
         fig, ax = plt.subplots()
         for code in self.boundary_codes:
-            xn = nc[c == code, 0]
-            yn = nc[c == code, 1]
+            idx = self._node_ids_by_code[code]
+            xn = nc[idx, 0]
+            yn = nc[idx, 1]
             if boundary_names is None:
                 label = f"Code {code}"
             else:
@@ -2293,8 +2417,7 @@ class Mesh(_UnstructuredFile):
 
         builder = MeshBuilder()
 
-        nc = geometry.node_coordinates
-        builder.SetNodes(nc[:, 0], nc[:, 1], nc[:, 2], geometry.codes)
+        builder.SetNodes(*geometry._nodes_to_dotnet())
         # builder.SetNodeIds(geometry.node_ids+1)
         # builder.SetElementIds(geometry.elements+1)
         builder.SetElements(geometry._element_table_to_dotnet())
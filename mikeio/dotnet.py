@@ -113,6 +113,34 @@ def to_dotnet_array(x):
             "asNetArray does not yet support dtype {}".format(dtype)
         )
 
+    return copy_to_dotnet_array(x, netArray)
+
+
+def copy_to_dotnet_array(x, netArray):
+    """
+    Copy numpy array into an existing .NET array
+
+    Parameters
+    ----------
+    x: np.array
+    netArray: System.Array
+        with same size and data type as x
+
+    Returns
+    -------
+    System.Array
+        netArray, now holding the values of x
+
+    Notes
+    -----
+    Allows a single .NET array to be reused as a buffer,
+    e.g. when writing many timesteps. Size and data type are not checked
+    on each copy, so that refilling the buffer is cheap: create netArray
+    once with to_dotnet_array from an array of the same shape and dtype.
+    """
+    if not x.flags.c_contiguous:
+        x = x.copy(order="C")
+
     try:  # Memmove
         destHandle = GCHandle.Alloc(netArray, GCHandleType.Pinned)
         sourcePtr = x.__array_interface__["data"][0]
@@ -135,7 +163,7 @@ def asnetarray_v2(x):
 
 def to_dotnet_float_array(x):
 
-    return to_dotnet_array(x.astype(np.float32))
+    return to_dotnet_array(x.astype(np.float32, copy=False))
 
 
 def to_numpy(src):
@@ -35,8 +35,8 @@ def get_valid_items_and_timesteps(dfs, items, time_steps):
             time_steps = slice(parts[0], parts[1])
 
     if isinstance(time_steps, slice):
-        freq = pd.tseries.offsets.DateOffset(seconds=dfs.timestep)
-        time = pd.date_range(dfs.start_time, periods=dfs.n_timesteps, freq=freq)
+        t_seconds = np.arange(dfs.n_timesteps) * dfs.timestep
+        time = pd.Timestamp(dfs.start_time) + pd.to_timedelta(t_seconds, unit="s")
         s = time.slice_indexer(time_steps.start, time_steps.stop)
         time_steps = list(range(s.start, s.stop))
 
@@ -88,10 +88,13 @@ def get_item_info(dfs, item_numbers):
     list[Iteminfo]
     """
     items = []
+    item_infos = dfs.ItemInfo
     for item in item_numbers:
-        name = dfs.ItemInfo[item].Name
-        eumItem = dfs.ItemInfo[item].Quantity.Item
-        eumUnit = dfs.ItemInfo[item].Quantity.Unit
+        item_info = item_infos[item]
+        quantity = item_info.Quantity
+        name = item_info.Name
+        eumItem = quantity.Item
+        eumUnit = quantity.Unit
         itemtype = EUMType(eumItem)
         unit = EUMUnit(eumUnit)
         item = ItemInfo(name, itemtype, unit)
@@ -3,7 +3,12 @@ import numpy as np
 from datetime import datetime, timedelta
 
 from DHI.Generic.MikeZero.DFS import DfsFileFactory, DfsBuilder
-from .dotnet import to_numpy, to_dotnet_float_array, from_dotnet_datetime
+from .dotnet import (
+    to_numpy,
+    to_dotnet_array,
+    copy_to_dotnet_array,
+    from_dotnet_datetime,
+)
 from .helpers import safe_length
 from .dutil import find_item
 from shutil import copyfile
@@ -54,11 +59,17 @@ def _clone(infilename, outfilename):
     builder.CreateFile(outfilename)
 
     # Copy static items
+    static_items = []
+    read_static = source.ReadStaticItemNext
     while True:
-        static_item = source.ReadStaticItemNext()
+        static_item = read_static()
         if static_item is None:
             break
-        builder.AddStaticItem(static_item)
+        static_items.append(static_item)
+
+    add_static = builder.AddStaticItem
+    for static_item in static_items:
+        add_static(static_item)
 
     # Get the file
     file = builder.GetFile()
@@ -68,6 +79,40 @@ def _clone(infilename, outfilename):
     return file
 
 
+def _is_deletevalue(d, deletevalue, out=None):
+    """Mask of delete values in float32 array d
+
+    Compares the bit patterns, which for the fixed delete value sentinel
+    is the same as an exact float comparison but cheaper.
+    """
+    bits = np.float32(deletevalue).view(np.uint32)
+    return np.equal(d.view(np.uint32), bits, out=out)
+
+
+def _scale_kernel(d, factor, offset, deletevalue, out, mask=None):
+    """out = d * factor + offset, keeping delete values of d"""
+    missing = _is_deletevalue(d, deletevalue, out=mask)
+    if factor == 1.0:
+        np.add(d, offset, out=out)
+    elif offset == 0.0:
+        np.multiply(d, factor, out=out)
+    else:
+        np.multiply(d, factor, out=out)
+        np.add(out, offset, out=out)
+    out[missing] = deletevalue
+    return out
+
+
+def _combine_kernel(a, b, deletevalue, op, out, mask=None, scratch=None):
+    """out = op(a, b), with delete value where either a or b is missing"""
+    missing = _is_deletevalue(a, deletevalue, out=mask)
+    missing |= _is_deletevalue(b, deletevalue, out=scratch)
+    valid = np.logical_not(missing, out=missing)
+    out.fill(deletevalue)
+    op(a, b, out=out, where=valid)
+    return out
+
+
 def scale(
     infilename, outfilename, offset=0.0, factor=1.0, item_numbers=None, item_names=None
 ):
@@ -89,37 +134,64 @@ def scale(
         item_names: list[str], optional
             Process only selected items, by name, takes precedence over item_numbers
         """
-    copyfile(infilename, outfilename)
-    dfs = DfsFileFactory.DfsGenericOpenEdit(outfilename)
+    dfs_i = DfsFileFactory.DfsGenericOpen(infilename)
 
     if item_names is not None:
-        item_numbers = find_item(dfs, item_names)
+        item_numbers = find_item(dfs_i, item_names)
+
+    if factor == 1.0 and offset == 0.0:
+        # nothing to scale
+        dfs_i.Close()
+        copyfile(infilename, outfilename)
+        return
 
+    n_items = safe_length(dfs_i.ItemInfo)
     if item_numbers is None:
-        n_items = safe_length(dfs.ItemInfo)
         item_numbers = list(range(n_items))
 
-    n_time_steps = dfs.FileInfo.TimeAxis.NumberOfTimeSteps
-    n_items = len(item_numbers)
+    # every item is written in order; only the selected ones are scaled
+    selected = set(item_numbers)
+
+    n_time_steps = dfs_i.FileInfo.TimeAxis.NumberOfTimeSteps
 
-    deletevalue = dfs.FileInfo.DeleteValueFloat
+    deletevalue = dfs_i.FileInfo.DeleteValueFloat
+    factor = np.float32(factor)
+    offset = np.float32(offset)
+
+    dfs_o = _clone(infilename, outfilename)
+
+    # one reusable output buffer, .NET array and delete value mask per item
+    outdata = [None] * n_items
+    darrays = [None] * n_items
+    masks = [None] * n_items
+
+    read = dfs_i.ReadItemTimeStepNext
+    write = dfs_o.WriteItemTimeStepNext
 
     for timestep in range(n_time_steps):
         for item in range(n_items):
 
-            itemdata = dfs.ReadItemTimeStep(item_numbers[item] + 1, timestep)
+            itemdata = read()
             time = itemdata.Time
-            d = to_numpy(itemdata.Data)
-            d[d == deletevalue] = np.nan
 
-            outdata = d * factor + offset
+            if item not in selected:
+                # data is already a float array, pass it on without conversion
+                write(time, itemdata.Data)
+                continue
 
-            outdata[np.isnan(outdata)] = deletevalue
-            darray = to_dotnet_float_array(outdata)
+            d = to_numpy(itemdata.Data)
+            if outdata[item] is None:
+                outdata[item] = np.empty_like(d)
+                darrays[item] = to_dotnet_array(outdata[item])
+                masks[item] = np.empty(d.shape, dtype=bool)
+            _scale_kernel(
+                d, factor, offset, deletevalue, out=outdata[item], mask=masks[item]
+            )
 
-            dfs.WriteItemTimeStep(item_numbers[item] + 1, timestep, time, darray)
+            write(time, copy_to_dotnet_array(outdata[item], darrays[item]))
 
-    dfs.Close()
+    dfs_i.Close()
+    dfs_o.Close()
 
 
 def sum(infilename_a, infilename_b, outfilename):
@@ -134,35 +206,7 @@ def sum(infilename_a, infilename_b, outfilename):
     outfilename: str
         full path to the output file
     """
-    copyfile(infilename_a, outfilename)
-
-    dfs_i_a = DfsFileFactory.DfsGenericOpen(infilename_a)
-    dfs_i_b = DfsFileFactory.DfsGenericOpen(infilename_b)
-    dfs_o = DfsFileFactory.DfsGenericOpenEdit(outfilename)
-
-    n_time_steps = dfs_i_a.FileInfo.TimeAxis.NumberOfTimeSteps
-    n_items = safe_length(dfs_i_a.ItemInfo)
-    # TODO Add checks to verify identical structure of file a and b
-
-    for timestep in range(n_time_steps):
-        for item in range(n_items):
-
-            itemdata_a = dfs_i_a.ReadItemTimeStep(item + 1, timestep)
-            d_a = to_numpy(itemdata_a.Data)
-
-            itemdata_b = dfs_i_b.ReadItemTimeStep(item + 1, timestep)
-            d_b = to_numpy(itemdata_b.Data)
-            time = itemdata_a.Time
-
-            outdata = d_a + d_b
-
-            darray = to_dotnet_float_array(outdata)
-
-            dfs_o.WriteItemTimeStep(item + 1, timestep, time, darray)
-
-    dfs_i_a.Close()
-    dfs_i_b.Close()
-    dfs_o.Close()
+    _process_dfs_files(infilename_a, infilename_b, outfilename, np.add)
 
 
 def diff(infilename_a, infilename_b, outfilename):
@@ -177,32 +221,60 @@ def diff(infilename_a, infilename_b, outfilename):
     outfilename : str
         full path to the output file
     """
+    _process_dfs_files(infilename_a, infilename_b, outfilename, np.subtract)
+
 
-    copyfile(infilename_a, outfilename)
+def _process_dfs_files(infilename_a, infilename_b, outfilename, op):
+    """Apply element-wise operation op(a, b) to two dfs files
+
+    Delete values in either file are kept as delete values in the output.
+    """
 
     dfs_i_a = DfsFileFactory.DfsGenericOpen(infilename_a)
     dfs_i_b = DfsFileFactory.DfsGenericOpen(infilename_b)
-    dfs_o = DfsFileFactory.DfsGenericOpenEdit(outfilename)
+    dfs_o = _clone(infilename_a, outfilename)
 
+    deletevalue = dfs_i_a.FileInfo.DeleteValueFloat
     n_time_steps = dfs_i_a.FileInfo.TimeAxis.NumberOfTimeSteps
     n_items = safe_length(dfs_i_a.ItemInfo)
     # TODO Add checks to verify identical structure of file a and b
 
+    # per item: one reusable output buffer, .NET array and two masks
+    outdata = [None] * n_items
+    darrays = [None] * n_items
+    masks = [None] * n_items
+    scratch = [None] * n_items
+
+    read_a = dfs_i_a.ReadItemTimeStepNext
+    read_b = dfs_i_b.ReadItemTimeStepNext
+    write = dfs_o.WriteItemTimeStepNext
+
     for timestep in range(n_time_steps):
         for item in range(n_items):
 
-            itemdata_a = dfs_i_a.ReadItemTimeStep(item + 1, timestep)
+            itemdata_a = read_a()
             d_a = to_numpy(itemdata_a.Data)
 
-            itemdata_b = dfs_i_b.ReadItemTimeStep(item + 1, timestep)
+            itemdata_b = read_b()
             d_b = to_numpy(itemdata_b.Data)
             time = itemdata_a.Time
 
-            outdata = d_a - d_b
-
-            darray = to_dotnet_float_array(outdata)
+            if outdata[item] is None:
+                outdata[item] = np.empty_like(d_a)
+                darrays[item] = to_dotnet_array(outdata[item])
+                masks[item] = np.empty(d_a.shape, dtype=bool)
+                scratch[item] = np.empty(d_a.shape, dtype=bool)
+            _combine_kernel(
+                d_a,
+                d_b,
+                deletevalue,
+                op,
+                out=outdata[item],
+                mask=masks[item],
+                scratch=scratch[item],
+            )
 
-            dfs_o.WriteItemTimeStep(item + 1, timestep, time, darray)
+            write(time, copy_to_dotnet_array(outdata[item], darrays[item]))
 
     dfs_i_a.Close()
     dfs_i_b.Close()
@@ -228,53 +300,61 @@ def concat(infilenames, outfilename):
     The list of input files have to be sorted, i.e. in chronological order
     """
 
-    dfs_i_a = DfsFileFactory.DfsGenericOpen(infilenames[0])
-
     dfs_o = _clone(infilenames[0], outfilename)
-
-    n_items = safe_length(dfs_i_a.ItemInfo)
-    dfs_i_a.Close()
-
-    current_time = datetime(1, 1, 1)  # beginning of time...
-
-    for i, infilename in enumerate(infilenames):
-
-        dfs_i = DfsFileFactory.DfsGenericOpen(infilename)
-        t_axis = dfs_i.FileInfo.TimeAxis
-        n_time_steps = t_axis.NumberOfTimeSteps
-        dt = t_axis.TimeStep
-        start_time = from_dotnet_datetime(t_axis.StartDateTime)
-
-        if i > 0 and start_time > current_time + timedelta(seconds=dt):
-            dfs_o.Close()
-            os.remove(outfilename)
-            raise Exception("Gap in time axis detected - not supported")
-
-        current_time = start_time
-
-        if i < (len(infilenames) - 1):
-            dfs_n = DfsFileFactory.DfsGenericOpen(infilenames[i + 1])
-            nf = dfs_n.FileInfo.TimeAxis.StartDateTime
-            next_start_time = datetime(
-                nf.Year, nf.Month, nf.Day, nf.Hour, nf.Minute, nf.Second
-            )
-            dfs_n.Close()
-
-        for timestep in range(n_time_steps):
-
-            current_time = start_time + timedelta(seconds=timestep * dt)
-            if i < (len(infilenames) - 1):
-                if current_time >= next_start_time:
-                    break
-
-            for item in range(n_items):
-
-                itemdata = dfs_i.ReadItemTimeStep(item + 1, timestep)
-                d = to_numpy(itemdata.Data)
-
-                darray = to_dotnet_float_array(d)
-
-                dfs_o.WriteItemTimeStepNext(0, darray)
-        dfs_i.Close()
-
-    dfs_o.Close()
+    write = dfs_o.WriteItemTimeStepNext
+
+    # every input file is opened once, the handle opened to get the start
+    # time of the next file is reused when that file is copied
+    dfs_i = None
+    dfs_n = None
+    try:
+        dfs_i = DfsFileFactory.DfsGenericOpen(infilenames[0])
+        n_items = safe_length(dfs_i.ItemInfo)
+        n_files = len(infilenames)
+
+        current_time = datetime(1, 1, 1)  # beginning of time...
+
+        for i in range(n_files):
+
+            t_axis = dfs_i.FileInfo.TimeAxis
+            n_time_steps = t_axis.NumberOfTimeSteps
+            dt = t_axis.TimeStep
+            start_time = from_dotnet_datetime(t_axis.StartDateTime)
+
+            if i > 0 and start_time > current_time + timedelta(seconds=dt):
+                dfs_o.Close()
+                dfs_o = None
+                os.remove(outfilename)
+                raise Exception("Gap in time axis detected - not supported")
+
+            current_time = start_time
+
+            is_last = i == (n_files - 1)
+            if not is_last:
+                dfs_n = DfsFileFactory.DfsGenericOpen(infilenames[i + 1])
+                next_start_time = from_dotnet_datetime(
+                    dfs_n.FileInfo.TimeAxis.StartDateTime
+                )
+
+            read = dfs_i.ReadItemTimeStepNext
+
+            for timestep in range(n_time_steps):
+
+                current_time = start_time + timedelta(seconds=timestep * dt)
+                if not is_last:
+                    if current_time >= next_start_time:
+                        break
+
+                for item in range(n_items):
+
+                    # data is already a float array, pass it on without conversion
+                    itemdata = read()
+                    write(0, itemdata.Data)
+            done, dfs_i, dfs_n = dfs_i, dfs_n, None
+            done.Close()
+
+    finally:
+        # close whatever is still open, also when an error occurred
+        for dfs in (dfs_i, dfs_n, dfs_o):
+            if dfs is not None:
+                dfs.Close()
@@ -1,3 +1,6 @@
+import os
+import copy
+from functools import lru_cache
 from datetime import date, datetime, timedelta
 import yaml
 import pandas as pd
@@ -12,11 +15,12 @@ from types import SimpleNamespace
 class NestedNamespace(SimpleNamespace):
     def __init__(self, dictionary, **kwargs):
         super().__init__(**kwargs)
-        for key, value in dictionary.items():
-            if isinstance(value, dict):
-                self.__setattr__(key, NestedNamespace(value))
-            else:
-                self.__setattr__(key, value)
+        self.__dict__.update(
+            {
+                key: NestedNamespace(value) if isinstance(value, dict) else value
+                for key, value in dictionary.items()
+            }
+        )
 
 
 class Pfs:
@@ -31,8 +35,12 @@ class Pfs:
 
         try:
             self._filename = filename
-            self._pfs2yaml()
-            self._data = yaml.load(self._yaml, Loader=yaml.CLoader)
+            st = os.stat(filename)
+            self._yaml, data = _parse_cached(
+                os.path.abspath(filename), st.st_mtime_ns, st.st_size
+            )
+            # the cached tree is shared, so work on a copy
+            self._data = copy.deepcopy(data)
             targets = list(self._data.keys())
             if len(targets) == 1:
                 self._data = self._data[targets[0]]
@@ -75,83 +83,89 @@ class Pfs:
             "use_end_time",
             "time_step_frequency",
         ]
-        rows = []
-        for i in range(n):
-
-            output = sub[f"OUTPUT_{i+1}"]
-            row = {key: output[key] for key in sel_keys}
-
-            rows.append(row)
-        df = pd.DataFrame(rows)
+        # gather one list per column and build the frame once
+        outputs = [sub[f"OUTPUT_{i+1}"] for i in range(n)]
+        cols = {key: [output[key] for output in outputs] for key in sel_keys}
+        df = pd.DataFrame(cols, columns=sel_keys)
 
         if included_only:
             df = df[df.include == 1]
         return df
 
-    def _pfs2yaml(self):
 
-        with (open(self._filename)) as f:
-            pfsstring = f.read()
+@lru_cache(maxsize=32)
+def _parse_cached(filename, mtime_ns, size):
+    """Parse pfs file, cached on file name, modification time and size"""
+    pfsyaml = _pfs2yaml(filename)
+    data = yaml.load(pfsyaml, Loader=yaml.CLoader)
+    return pfsyaml, data
 
-        lines = pfsstring.split("\n")
 
-        output = []
-        output.append("---")
+def _pfs2yaml(filename):
 
-        self._level = 0
+    with (open(filename)) as f:
+        pfsstring = f.read()
 
-        for line in lines:
-            adj_line = self._parse_line(line)
-            output.append(adj_line)
+    lines = pfsstring.split("\n")
 
-        self._yaml = "\n".join(output)
+    output = []
+    output.append("---")
 
-    def _parse_line(self, line):
-        s = line.strip()
+    level = 0
 
-        if len(s) > 0:
-            if s[0] == "[":
-                s = s.replace("[", "")
+    for line in lines:
+        adj_line, level = _parse_line(line, level)
+        output.append(adj_line)
 
-            if s[-1] == "]":
-                s = s.replace("]", ":")
+    return "\n".join(output)
 
-        s = s.replace("//", "#").replace("|", "")  # TODO
 
-        if len(s) > 0 and s[0] != "!":
-            if "=" in s:
-                idx = s.index("=")
+def _parse_line(line, level):
+    s = line.strip()
 
-                key = s[0:idx]
-                key = key.strip()
-                value = s[(idx + 1) :]
-                key = key.lower()
+    if len(s) > 0:
+        if s[0] == "[":
+            s = s.replace("[", "")
 
-                if s.count("'") == 2:  # This is a quoted string and not a list
-                    s = s
-                else:
-                    if "," in value:
-                        value = f"[{value}]"
+        if s[-1] == "]":
+            s = s.replace("]", ":")
+
+    s = s.replace("//", "#").replace("|", "")  # TODO
 
-                if key == "start_time":
-                    v = eval(value)
-                    value = datetime(*v)
+    if len(s) > 0 and s[0] != "!":
+        if "=" in s:
+            idx = s.index("=")
 
-                s = f"{key}: {value}"
+            key = s[0:idx]
+            key = key.strip()
+            value = s[(idx + 1) :]
+            key = key.lower()
 
-        if "EndSect" in line:
-            s = ""
+            if s.count("'") == 2:  # This is a quoted string and not a list
+                s = s
+            else:
+                if "," in value:
+                    value = f"[{value}]"
+
+            if key == "start_time":
+                v = eval(value)
+                value = datetime(*v)
+
+            s = f"{key}: {value}"
+
+    if "EndSect" in line:
+        s = ""
 
-        ws = " " * 2 * self._level
-        adj_line = ws + s
+    ws = " " * 2 * level
+    adj_line = ws + s
 
-        s = line.strip()
-        if len(s) > 0 and s[0] == "[":
-            self._level += 1
-        if "EndSect" in line:
-            self._level -= 1
+    s = line.strip()
+    if len(s) > 0 and s[0] == "[":
+        level += 1
+    if "EndSect" in line:
+        level -= 1
 
-        return adj_line
+    return adj_line, level
 
 
 # TODO come up with a better name
@@ -231,20 +245,19 @@ class PfsCore:
 
     def _find_target(self, filename):
 
+        # the target is the first section header, stop reading once found
         with open(filename) as f:
-            lines = f.readlines()
-
-        for line in lines:
-            if "//" in line:
-                text, comment = line.split("//")
-            else:
-                text = line
+            for line in f:
+                if "//" in line:
+                    text, comment = line.split("//")
+                else:
+                    text = line
 
-            if "[" in text:
-                startidx = text.index("[") + 1
-                endidx = text.index("]")
-                target = text[startidx:endidx]
-                return target
+                if "[" in text:
+                    startidx = text.index("[") + 1
+                    endidx = text.index("]")
+                    target = text[startidx:endidx]
+                    return target
 
         return None
 
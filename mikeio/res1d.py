@@ -47,7 +47,8 @@ class QueryData:
     @staticmethod
     def from_dotnet_to_python(array):
         """Convert .NET array to numpy."""
-        return np.fromiter(array, np.float64)
+        # bulk copy of the float[] memory instead of iterating element by element
+        return to_numpy(array).astype(np.float64)
 
     @property
     def quantity(self):
@@ -159,11 +160,9 @@ class Res1D:
 
         queries = queries if isinstance(queries, list) else [queries]
 
-        df = pd.DataFrame(index=self.time_index)
-        for query in queries:
-            df[str(query)] = query.get_values(self)
-
-        return df
+        # all queries run against the loaded file, frame is built once
+        data = {str(query): query.get_values(self) for query in queries}
+        return pd.DataFrame(data, index=self.time_index)
 
     def read_all(self):
         """ Read all data from res1d file to dataframe. """
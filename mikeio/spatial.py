@@ -90,9 +90,6 @@ class Grid2D:
     _dy = None
     _ny = None
 
-    _xx = None
-    _yy = None
-
     @property
     def x(self):
         """array of x-coordinates (single row)
@@ -161,27 +158,27 @@ class Grid2D:
 
     @property
     def xx(self):
-        """2d array of all x-coordinates 
+        """2d array of all x-coordinates (read-only view)
         """
-        if self._xx is None:
-            self._create_meshgrid(self.x, self.y)
-        return self._xx
+        return np.broadcast_to(np.asarray(self.x), (self.ny, self.nx))
 
     @property
     def yy(self):
-        """2d array of all y-coordinates 
+        """2d array of all y-coordinates (read-only view)
         """
-        if self._yy is None:
-            self._create_meshgrid(self.x, self.y)
-        return self._yy
+        y = np.asarray(self.y)
+        return np.broadcast_to(y[:, np.newaxis], (self.ny, self.nx))
 
     @property
     def xy(self):
         """ n-by-2 array of x- and y-coordinates 
         """
-        xcol = self.xx.reshape(-1, 1)
-        ycol = self.yy.reshape(-1, 1)
-        return np.column_stack([xcol, ycol])
+        xy = np.empty((self.n, 2))
+        # fill both columns through a (ny, nx, 2) view, broadcasting the axes
+        grid = xy.reshape(self.ny, self.nx, 2)
+        grid[:, :, 0] = np.asarray(self.x)[np.newaxis, :]
+        grid[:, :, 1] = np.asarray(self.y)[:, np.newaxis]
+        return xy
 
     @property
     def coordinates(self):
@@ -223,7 +220,7 @@ class Grid2D:
         >>> g = Grid2D(x, y)
         
         """
-        if (x is not None) and (len(x) == 4):
+        if (bbox is None) and (x is not None) and (np.size(x) == 4):
             # first positional argument 'x' is probably bbox
             if (y is None) or ((dxdy is not None) or (shape is not None)):
                 bbox, x = x, bbox
@@ -310,20 +307,14 @@ class Grid2D:
         self._ny = len(y)
         self._dy = y[1] - y[0]
         self._y = y
-        self._xx, self._yy = None, None
 
     def _create_x_axis(self, x0, dx, nx):
         self._x1 = x0 + dx * (nx - 1)
-        self._x = np.linspace(x0, self._x1, nx)
-        self._xx, self._yy = None, None
+        self._x = x0 + dx * np.arange(nx, dtype=float)
 
     def _create_y_axis(self, y0, dy, ny):
         self._y1 = y0 + dy * (ny - 1)
-        self._y = np.linspace(y0, self._y1, ny)
-        self._xx, self._yy = None, None
-
-    def _create_meshgrid(self, x, y):
-        self._xx, self._yy = np.meshgrid(x, y)
+        self._y = y0 + dy * np.arange(ny, dtype=float)
 
     def contains(self, xy):
         """test if a list of points are inside grid
@@ -347,21 +338,28 @@ class Grid2D:
         else:
             raise ValueError("crazy")
 
-        xinside = (self.x0 <= xp) & (xp <= self.x1)
-        yinside = (self.y0 <= yp) & (yp <= self.y1)
-        return xinside & yinside
+        # write each bounds test into one reused scratch array
+        inside = np.empty(np.shape(xp), dtype=bool)
+        tmp = np.empty_like(inside)
+        np.greater_equal(xp, self.x0, out=inside)
+        inside &= np.less_equal(xp, self.x1, out=tmp)
+        inside &= np.greater_equal(yp, self.y0, out=tmp)
+        inside &= np.less_equal(yp, self.y1, out=tmp)
+
+        if inside.ndim == 0:
+            # single point
+            return bool(inside)
+        return inside
 
     def _to_element_table(self, index_base=0):
 
-        elem_table = []
-        for elx in range(self.nx - 1):
-            # each col
-            for ely in range(self.ny - 1):
-                # each row (in this col)
-                n1 = ely * self.nx + elx + index_base
-                n2 = (ely + 1) * self.nx + elx + index_base
-                elem_table.append([n1, n1 + 1, n2 + 1, n2])
-        return elem_table
+        # lower-left node of each element, col by col, row by row within col
+        nx, ny = self.nx, self.ny
+        elx = np.arange(nx - 1)
+        ely = np.arange(ny - 1)
+        n1 = (ely[np.newaxis, :] * nx + elx[:, np.newaxis]).ravel() + index_base
+        n2 = n1 + nx
+        return np.column_stack([n1, n1 + 1, n2 + 1, n2])
 
     def to_mesh(self, outfilename, projection=None, z=None):
         """export grid to mesh file
@@ -378,22 +376,27 @@ class Grid2D:
         if projection is None:
             projection = "LONG/LAT"
 
-        x = self.xy[:, 0]
-        y = self.xy[:, 1]
+        nx, ny, n = self.nx, self.ny, self.n
+
+        # node coordinates row by row, same order as xy
+        x = np.tile(np.asarray(self.x, dtype=float), ny)
+        y = np.repeat(np.asarray(self.y, dtype=float), nx)
         if z is None:
-            z = np.zeros(self.n)
-        codes = np.zeros(self.n, dtype=int)
-        codes[y == self.y1] = 5  # north
-        codes[x == self.x1] = 4  # east
-        codes[y == self.y0] = 3  # south
-        codes[x == self.x0] = 2  # west
-        codes[(y == self.y1) & (x == self.x0)] = 5  # corner->north
+            z = np.zeros(n)
+        codes = np.zeros(n, dtype=int)
+        # nodes are ordered row by row, so the boundaries are rows/cols of a view
+        codes2d = codes.reshape(ny, nx)
+        codes2d[-1, :] = 5  # north
+        codes2d[:, -1] = 4  # east
+        codes2d[0, :] = 3  # south
+        codes2d[:, 0] = 2  # west
+        codes2d[-1, 0] = 5  # corner->north
 
         builder = MeshBuilder()
         builder.SetNodes(x, y, z, codes)
 
         elem_table = self._to_element_table(index_base=1)
-        builder.SetElements(asnetarray_v2(elem_table))
+        builder.SetElements(asnetarray_v2(elem_table.tolist()))
 
         builder.SetProjection(projection)
         quantity = eumQuantity.Create(EUMType.Bathymetry, EUMUnit.meter)
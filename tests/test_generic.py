@@ -38,6 +38,19 @@ def test_multiply_constant(tmpdir):
     assert scaledvalue == pytest.approx(expected)
 
 
+def test_scale_identity(tmpdir):
+
+    infilename = "tests/testdata/random.dfs0"
+    outfilename = os.path.join(tmpdir.dirname, "identity.dfs0")
+    scale(infilename, outfilename, offset=0.0, factor=1.0)
+
+    org = mikeio.read(infilename)
+
+    scaled = mikeio.read(outfilename)
+
+    np.testing.assert_array_equal(scaled.data[0], org.data[0])
+
+
 def test_multiply_constant_single_item_number(tmpdir):
 
     infilename = "tests/testdata/wind_north_sea.dfsu"
@@ -190,6 +203,27 @@ def test_diff_dfsu(tmpdir):
     assert scaledvalue == pytest.approx(expected)
 
 
+def test_sum_delete_values_unchanged(tmpdir):
+
+    infilename = "tests/testdata/gebco_sound.dfs2"
+    outfilename = os.path.join(tmpdir.dirname, "sum.dfs2")
+    mikeio.generic.sum(infilename, infilename, outfilename)
+
+    org = mikeio.read(infilename)
+
+    summed = mikeio.read(outfilename)
+
+    orgvalue = org["Elevation"][0, 0, 0]
+    summedvalue = summed["Elevation"][0, 0, 0]
+    assert summedvalue == pytest.approx(orgvalue * 2)
+
+    orgvalue = org["Elevation"][0, 100, 0]
+    assert np.isnan(orgvalue)
+
+    summedvalue = summed["Elevation"][0, 100, 0]
+    assert np.isnan(summedvalue)
+
+
 def test_concat_overlapping(tmpdir):
     infilename_a = "tests/testdata/tide1.dfs1"
     infilename_b = "tests/testdata/tide2.dfs1"
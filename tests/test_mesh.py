@@ -67,6 +67,18 @@ def test_set_codes():
     assert msh.codes[2] == 7
 
 
+def test_set_codes_updates_boundary_codes():
+    filename = os.path.join("tests", "testdata", "odense_rough.mesh")
+    msh = Mesh(filename)
+    assert 2 in msh.boundary_codes
+    codes = msh.codes.copy()
+    codes[codes == 2] = 7
+    msh.set_codes(codes)
+    assert 2 not in msh.boundary_codes
+    assert 7 in msh.boundary_codes
+    assert msh.get_node_coords(code=7).shape[0] == sum(codes == 7)
+
+
 def test_write(tmpdir):
     outfilename = os.path.join(tmpdir.dirname, "simple.mesh")
     meshfilename = os.path.join("tests", "testdata", "odense_rough.mesh")
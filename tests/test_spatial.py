@@ -119,6 +119,22 @@ def test_to_mesh():
     os.remove(outfilename)  # clean up
 
 
+def test_to_mesh_codes():
+    outfilename = "temp_codes.mesh"
+
+    g = Grid2D([0, 0, 1, 5], dxdy=0.5)
+    g.to_mesh(outfilename)
+
+    mesh = Mesh(outfilename)
+    codes = mesh.codes.reshape(g.ny, g.nx)
+    assert np.all(codes[1:-1, 1:-1] == 0)
+    assert np.all(codes[1:-1, 0] == 2)  # west
+    assert np.all(codes[0, 1:] == 3)  # south
+    assert np.all(codes[1:, -1] == 4)  # east
+    assert np.all(codes[-1, :-1] == 5)  # north
+    os.remove(outfilename)  # clean up
+
+
 def test_xy_to_bbox():
     bbox = [0, 0, 1, 5]
     g = Grid2D(bbox)